@@ -18,21 +18,42 @@ import re
 import json
 import time
 import random
+import socket
 import logging
+import threading
 import warnings
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
+from contextlib import ExitStack
+from functools import lru_cache
+from itertools import chain
 from urllib.parse import (
-    quote_plus, urljoin, urlparse, unquote, parse_qs,
+    quote_plus, urljoin, unquote, parse_qs, parse_qsl,
+    urlencode, urlsplit, urlunsplit,
+)
+from concurrent.futures import (
+    ThreadPoolExecutor, Future, as_completed, wait, FIRST_COMPLETED,
+    TimeoutError as FutureTimeoutError,
 )
-from concurrent.futures import ThreadPoolExecutor, as_completed
 
 import requests
 from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
 from urllib3.util.retry import Retry
+from urllib3.exceptions import ReadTimeoutError
 from requests.packages.urllib3.exceptions import InsecureRequestWarning
-from bs4 import BeautifulSoup
+import lxml.html
+from lxml import etree
 from ddgs import DDGS
 
+# orjson parses JSON-LD blocks several times faster; the stdlib parser is
+# only a fallback for environments installed without requirements.txt.
+# Its JSONDecodeError subclasses json.JSONDecodeError, so handling is shared.
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 warnings.filterwarnings("ignore", category=InsecureRequestWarning)
 
 logging.basicConfig(level=logging.INFO)
@@ -40,14 +61,18 @@ logger = logging.getLogger(__name__)
 
 # ---- Regex patterns -------------------------------------------------------
 
-EMAIL_RE = re.compile(
-    r"[a-zA-Z0-9._%+\-]+@[a-zA-Z0-9.\-]+\.[a-zA-Z]{2,}", re.I
-)
+_EMAIL_PATTERN = r"[a-zA-Z0-9._%+\-]+@[a-zA-Z0-9.\-]+\.[a-zA-Z]{2,}"
+EMAIL_RE = re.compile(_EMAIL_PATTERN, re.I)
 
+# At least one separator (or a bracketed area code) is required so bare
+# digit runs in inline CSS/JS are not picked up as phone numbers.
 PHONE_RE = re.compile(
     r"(?:\+?\d{1,4}[\s\-.]?)?"          # country code
-    r"(?:\(?\d{1,5}\)?[\s\-.]?)?"        # area code
-    r"\d{2,4}[\s\-.]?\d{2,4}[\s\-.]?\d{0,4}",
+    r"(?:"
+    r"\(\d{1,5}\)[\s\-.]?\d{2,4}[\s\-.]?"  # (area) local
+    r"|(?:\d{1,5}[\s\-.]?)?\d{2,4}[\s\-.]"  # area local-
+    r")"
+    r"\d{2,4}[\s\-.]?\d{0,4}",
 )
 
 # False-positive phone patterns (dates, zip codes, CSS, etc.)
@@ -62,6 +87,20 @@ PHONE_FALSE_POSITIVES = re.compile(
     r')$', re.I
 )
 
+# Characters kept when normalising a phone number
+_PHONE_CLEAN_RE = re.compile(r"[^\d+\-() ]")
+
+# Same for a cleaned lead's phone field, which may hold several numbers
+_PHONE_STRIP_RE = re.compile(r"[^\d+\-();, ]")
+
+# Element text that suggests a nearby phone number
+_CONTACT_CTX_RE = re.compile(
+    r"(?:phone|tel|call|mobile|whatsapp|contact)", re.I
+)
+
+# Separators between a business name and the rest of a page title
+_TITLE_SEPS = (" | ", " - ", " \u2014 ", " \u2013 ")
+
 EMAIL_BLACKLIST = {
     "example.com", "test.com", "email.com", "domain.com",
     "yoursite.com", "company.com", "website.com", "sentry.io",
@@ -89,6 +128,29 @@ SOCIAL_PATTERNS = {
     ),
 }
 
+# Host hints per platform: a cheap substring test that rejects the vast
+# majority of hrefs before any SOCIAL_PATTERNS regex runs.
+_SOCIAL_HINTS = (
+    ("facebook", "facebook.com"),
+    ("instagram", "instagram.com"),
+    ("twitter", "twitter.com"),
+    ("twitter", "x.com"),
+    ("linkedin", "linkedin.com"),
+    ("youtube", "youtube.com"),
+)
+_ANY_SOCIAL = tuple(hint for _, hint in _SOCIAL_HINTS)
+
+# Emails + social profile URLs in a single scan of a page's raw source;
+# the matching kind is read back from ``m.lastgroup``.
+_CONTACTS_RE = re.compile(
+    "(?i)"
+    + f"(?P<email>{_EMAIL_PATTERN})|"
+    + "|".join(
+        f"(?P<{platform}>{pattern.pattern})"
+        for platform, pattern in SOCIAL_PATTERNS.items()
+    )
+)
+
 # Domains to skip when crawling (search engines, social, CDN, etc.)
 SKIP_DOMAINS = {
     "google.com", "bing.com", "yahoo.com", "facebook.com",
@@ -100,12 +162,202 @@ SKIP_DOMAINS = {
     "googleusercontent.com", "yelp.com", "duckduckgo.com",
 }
 
+# ".google.com", ... — lets one str.endswith() call test a host and all
+# of its subdomains against SKIP_DOMAINS.
+_SKIP_SUFFIXES = tuple("." + d for d in SKIP_DOMAINS)
+
+
+@lru_cache(maxsize=8192)
+def _url_host(url: str) -> str:
+    """Lower-cased host of *url* (cached: result URLs repeat a lot)."""
+    return urlsplit(url).netloc.lower()
+
+
+def _canonical_url(url: str) -> str:
+    """
+    Normalise *url* for duplicate detection: lower-case scheme and host,
+    no trailing slash, no fragment and no ``utm_*`` tracking params.
+    """
+    parts = urlsplit(url)
+    query = urlencode([
+        (k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+        if not k.lower().startswith("utm_")
+    ])
+    return urlunsplit((
+        parts.scheme.lower(), parts.netloc.lower(),
+        parts.path.rstrip("/"), query, "",
+    ))
+
+
+def _site_host(url: str) -> str:
+    """Host of *url* without a leading ``www.``."""
+    host = _url_host(url)
+    return host[4:] if host.startswith("www.") else host
+
+
+# ---- HTML parsing (lxml) --------------------------------------------------
+
+def _has_class(name: str) -> str:
+    """XPath predicate equivalent to the CSS ``.name`` class selector."""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+_XP_TITLE = etree.XPath("(//title)[1]/text()", smart_strings=False)
+_XP_META_DESC = etree.XPath(
+    "//meta[@name='description']/@content", smart_strings=False,
+)
+_XP_LD_JSON = etree.XPath(
+    "//script[@type='application/ld+json']/text()", smart_strings=False,
+)
+_XP_ANCHORS = etree.XPath("//a[@href]")
+# Elements whose ``.string`` (BeautifulSoup's ``string=`` match) mentions
+# phone/contact wording: a single child node, possibly through a chain of
+# single-child tags like <p><strong>Call us: ...</strong></p>.  Wrapper
+# divs that merely start with "Contact" don't get their whole subtree
+# scanned for numbers.
+_XP_CONTACT_CTX = etree.XPath(
+    "//*[self::p or self::span or self::div or self::a or self::li]"
+    "[count(node()) = 1][not(.//*[count(node()) > 1])]"
+    f"[re:test(string(.), '{_CONTACT_CTX_RE.pattern}', 'i')]",
+    namespaces={"re": "http://exslt.org/regular-expressions"},
+)
+
+
+# Search-result pages
+_XP_TEXT = etree.XPath(
+    ".//text()[not(parent::script or parent::style)]", smart_strings=False,
+)
+_XP_GOOGLE_RESULTS = etree.XPath(f"//div[{_has_class('g')}]")
+_XP_GOOGLE_SNIPPETS = tuple(etree.XPath(x) for x in (
+    f".//div[{_has_class('VwiC3b')}]",
+    ".//div[@data-sncf]",
+    f".//span[{_has_class('st')}]",
+))
+_XP_BING_RESULTS = etree.XPath(f"//li[{_has_class('b_algo')}]")
+_XP_BING_TITLE_LINK = etree.XPath(".//h2//a")
+_XP_BING_CAPTION = etree.XPath(f".//div[{_has_class('b_caption')}]//p")
+_XP_BING_NEXT_PAGE = etree.XPath(f"//a[{_has_class('sb_pagN')}]")
+
+
+def _el_text(el) -> str:
+    """Visible text of *el*, like BeautifulSoup's ``get_text(strip=True)``."""
+    return "".join(t.strip() for t in _XP_TEXT(el))
+
+
+def _next_element(el):
+    """Next sibling element of *el*, skipping comments / PIs."""
+    nxt = el.getnext()
+    while nxt is not None and not isinstance(nxt.tag, str):
+        nxt = nxt.getnext()
+    return nxt
+
+
+def _ld_items(ld_data) -> list:
+    """Flatten a JSON-LD payload (object, array, ``@graph``) into nodes."""
+    items: list = []
+    for node in ld_data if isinstance(ld_data, list) else [ld_data]:
+        if isinstance(node, dict) and isinstance(node.get("@graph"), list):
+            items.extend(node["@graph"])
+        else:
+            items.append(node)
+    return items
+
+
+_local = threading.local()
+
+
+def _parse_html(text: str):
+    """Parse *text* into an lxml document using a per-thread parser."""
+    if not hasattr(_local, "html_parser"):
+        _local.html_parser = lxml.html.HTMLParser(encoding="utf-8")
+    return lxml.html.document_fromstring(
+        text.encode("utf-8", "replace"), parser=_local.html_parser,
+    )
+
+
+# Only the first part of a page is read when deep-scraping: contact
+# details sit in the visible HTML, not in trailing script bundles.
+_MAX_PAGE_BYTES = 300_000
+
+# Wall-clock budget for fetching the pages of one website.  requests' own
+# timeout only bounds each socket read, so a server trickling bytes could
+# otherwise hold a fetch worker for far longer.
+_PAGE_BUDGET = 8.0
+_READ_CHUNK = 16_384
+
+# Shared pool for per-site page fetches.  Long-lived so worker threads
+# (and their pooled connections) are reused across sites and crawls
+# instead of being spun up for every website.
+_PAGE_FETCH_POOL = ThreadPoolExecutor(
+    max_workers=128, thread_name_prefix="web-fetch",
+)
+
+
+# ---- HTTP plumbing ---------------------------------------------------------
+
+# Keep-alive probes stop idle pooled sockets from being silently dropped
+# by NAT / load balancers between a search burst and the deep-scrape.
+_KEEPALIVE_SOCKET_OPTIONS = HTTPConnection.default_socket_options + [
+    (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+] + [
+    (socket.IPPROTO_TCP, getattr(socket, name), value)
+    for name, value in (("TCP_KEEPIDLE", 30), ("TCP_KEEPINTVL", 10))
+    if hasattr(socket, name)
+]
+
+
+class _KeepAliveAdapter(HTTPAdapter):
+    """HTTPAdapter whose pooled connections enable TCP keep-alive."""
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs.setdefault("socket_options", _KEEPALIVE_SOCKET_OPTIONS)
+        super().init_poolmanager(*args, **kwargs)
+
+
+class _CappedRetry(Retry):
+    """Retry that honours Retry-After, but never waits more than 10s."""
+
+    MAX_RETRY_AFTER = 10.0
+
+    def get_retry_after(self, response):
+        retry_after = super().get_retry_after(response)
+        if retry_after is None:
+            return None
+        return min(retry_after, self.MAX_RETRY_AFTER)
+
+
+def _build_session(user_agent: str, max_retries) -> requests.Session:
+    """HTTP session with connection pooling, keep-alive and *max_retries*."""
+    session = requests.Session()
+    session.verify = False
+    session.headers.update({
+        "User-Agent": user_agent,
+        "Accept": (
+            "text/html,application/xhtml+xml,application/xml;"
+            "q=0.9,image/avif,image/webp,*/*;q=0.8"
+        ),
+        "Accept-Language": "en-US,en;q=0.9",
+        "Accept-Encoding": "gzip, deflate, br",
+        "DNT": "1",
+        "Connection": "keep-alive",
+        "Upgrade-Insecure-Requests": "1",
+    })
+    # Sized for peak fan-out (search threads + deep-scrape page
+    # fetches) so connections aren't discarded as "pool is full".
+    adapter = _KeepAliveAdapter(
+        pool_connections=64, pool_maxsize=128, pool_block=False,
+        max_retries=max_retries,
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
 
 # ---------------------------------------------------------------------------
 # Data class
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True)
 class WebLead:
     """A business lead found via web crawling."""
     business_name: str = ""
@@ -122,6 +374,14 @@ class WebLead:
     twitter: str = ""
     linkedin: str = ""
     youtube: str = ""
+    # Lower-cased host of ``website``, set together with it; lets the
+    # merge and clean_web_leads dedup without re-parsing the URL
+    domain_key: str = ""
+
+    def to_dict(self) -> dict:
+        """Plain dict of the fields (all flat strings, so no deep copy)."""
+        # slots=True puts the fields in __slots__, in declaration order
+        return {name: getattr(self, name) for name in self.__slots__}
 
 
 # ---------------------------------------------------------------------------
@@ -163,11 +423,37 @@ class WebCrawlerScraper:
         ),
     ]
 
+    # Minimum seconds between requests to the same search engine.  Each
+    # engine is throttled on its own, so they all proceed in parallel.
+    HOST_MIN_INTERVAL = {
+        "www.google.com": 2.5,
+        "www.bing.com": 1.0,
+        "duckduckgo.com": 0.5,
+    }
+
+    # Concurrent queries per search engine; each engine is throttled on
+    # its own, so extra workers there would only sleep
+    SEARCH_WORKERS_PER_ENGINE = 3
+
+    # Minimum seconds between deep-scrape progress reports
+    PROGRESS_INTERVAL = 0.5
+
+    # Concurrent website deep scrapes per crawl
+    DEEP_SCRAPE_WORKERS = 15
+
+    # Wall-clock budget for Phase 2: this many seconds per website, but
+    # never less than the minimum.  Sites still pending are skipped.
+    DEEP_SCRAPE_MIN_BUDGET = 30.0
+    DEEP_SCRAPE_SECS_PER_SITE = 0.5
+
     def __init__(self, headless: bool = True):
         self.headless = headless
         self._progress_callback = None
         self._should_stop = False
-        self._partial_leads: list[dict] = []
+        # Kept as WebLead objects; dicts are only built when read
+        self._partial_leads: list[WebLead] = []
+        # len(_partial_leads), published to _scrape_stats when reporting
+        self._leads_found = 0
         self._scrape_stats = {
             "queries_completed": 0,
             "total_queries": 0,
@@ -177,27 +463,23 @@ class WebCrawlerScraper:
             "phase": "idle",
         }
 
-        # Reusable HTTP session with connection pooling
-        self._http_session = requests.Session()
-        self._http_session.verify = False
-        self._http_session.headers.update({
-            "User-Agent": random.choice(self.USER_AGENTS),
-            "Accept": (
-                "text/html,application/xhtml+xml,application/xml;"
-                "q=0.9,image/avif,image/webp,*/*;q=0.8"
-            ),
-            "Accept-Language": "en-US,en;q=0.9",
-            "Accept-Encoding": "gzip, deflate, br",
-            "DNT": "1",
-            "Connection": "keep-alive",
-            "Upgrade-Insecure-Requests": "1",
-        })
-        adapter = HTTPAdapter(
-            pool_connections=15, pool_maxsize=30,
-            max_retries=Retry(total=2, backoff_factor=0.05),
-        )
-        self._http_session.mount("https://", adapter)
-        self._http_session.mount("http://", adapter)
+        # Module-wide session: pooled connections outlive this instance
+        self._http_session = _SESSION
+        self._page_session = _PAGE_SESSION
+
+        # One DDGS client per scraper so its HTTP session is reused across
+        # queries; created lazily and guarded since queries run in threads.
+        self._ddgs: DDGS | None = None
+        self._ddgs_lock = threading.Lock()
+
+        # Per-host request slots (time.monotonic() values), see _throttle
+        self._next_allowed: dict[str, float] = {}
+        self._blocked_until: dict[str, float] = {}
+        self._throttle_lock = threading.Lock()
+
+        # Canonical URLs already returned by any engine during this scrape
+        self._seen_urls: set[str] = set()
+        self._seen_lock = threading.Lock()
 
     def set_progress_callback(self, callback):
         self._progress_callback = callback
@@ -207,7 +489,7 @@ class WebCrawlerScraper:
 
     def get_partial_leads(self) -> list[dict]:
         """Return leads collected so far (used when stopping early)."""
-        return list(self._partial_leads)
+        return [lead.to_dict() for lead in self._partial_leads]
 
     @property
     def scrape_stats(self) -> dict:
@@ -224,9 +506,63 @@ class WebCrawlerScraper:
         """Check that a URL is a real external business site."""
         if not url or not url.startswith("http"):
             return False
-        domain = urlparse(url).netloc.lower()
-        root = ".".join(domain.split(".")[-2:])
-        return root not in SKIP_DOMAINS
+        return not ("." + _url_host(url)).endswith(_SKIP_SUFFIXES)
+
+    def _claim_url(self, url: str) -> bool:
+        """
+        Record *url* as seen; False if it (or a trivially different
+        variant) was already returned by any query or engine.
+        """
+        key = _canonical_url(url)
+        with self._seen_lock:
+            if key in self._seen_urls:
+                return False
+            self._seen_urls.add(key)
+        return True
+
+    def _throttle(self, host: str, backoff: float = 0.0):
+        """
+        Wait for the next free request slot for *host*.
+
+        Every call reserves a slot ``HOST_MIN_INTERVAL`` (plus jitter)
+        after the previous one, so concurrent queries to one engine are
+        spaced out without delaying requests to other hosts.  *backoff*
+        blocks the host for that long, e.g. after a CAPTCHA; callers
+        already waiting on an earlier slot re-queue behind the block.
+        """
+        interval = self.HOST_MIN_INTERVAL.get(host, 0.0)
+        earliest = time.monotonic() + backoff
+        while True:
+            with self._throttle_lock:
+                if backoff:
+                    self._blocked_until[host] = max(
+                        earliest, self._blocked_until.get(host, 0.0),
+                    )
+                    backoff = 0.0
+                slot = max(earliest, self._next_allowed.get(host, 0.0))
+                self._next_allowed[host] = (
+                    slot + interval * random.uniform(1.0, 1.5)
+                )
+            while True:
+                blocked = self._blocked_until.get(host, 0.0)
+                if blocked > slot:
+                    earliest = blocked
+                    break
+                delay = slot - time.monotonic()
+                if delay <= 0 or self._should_stop:
+                    return
+                time.sleep(min(delay, 0.5))
+
+    def _back_off(self, host: str, resp: requests.Response):
+        """Block *host* for its Retry-After (capped at 60s) or 15-20s."""
+        try:
+            wait = float(resp.headers.get("Retry-After", ""))
+            wait = max(min(wait, 60.0), 0.0)
+        except ValueError:
+            wait = 10 + random.uniform(5, 10)
+        logger.warning("%s HTTP %d — backing off %.0fs",
+                       host, resp.status_code, wait)
+        self._throttle(host, backoff=wait)
 
     def _random_ua_headers(self, referer: str = "") -> dict:
         """Return a fresh set of headers with a random User-Agent."""
@@ -299,9 +635,9 @@ class WebCrawlerScraper:
         Falls back to div.g containers if present.
         """
         results: list[dict] = []
-        seen: set[str] = set()
 
         for page in range(num_pages):
+            self._throttle("www.google.com")
             if self._should_stop:
                 break
 
@@ -318,6 +654,9 @@ class WebCrawlerScraper:
                     ),
                     timeout=12,
                 )
+                if resp.status_code == 429:
+                    self._back_off("www.google.com", resp)
+                    continue
                 if resp.status_code != 200:
                     logger.warning("Google HTTP %d", resp.status_code)
                     continue
@@ -325,7 +664,9 @@ class WebCrawlerScraper:
                 lower = resp.text.lower()
                 if "captcha" in lower or "unusual traffic" in lower:
                     logger.warning("Google CAPTCHA on HTTP — backing off")
-                    time.sleep(10 + random.uniform(5, 10))
+                    self._throttle(
+                        "www.google.com", backoff=10 + random.uniform(5, 10),
+                    )
                     resp = self._http_session.get(
                         "https://www.google.com/search",
                         params={
@@ -342,11 +683,11 @@ class WebCrawlerScraper:
                         logger.error("Still blocked by Google — skipping.")
                         break
 
-                soup = BeautifulSoup(resp.text, "lxml")
+                root = _parse_html(resp.text)
 
                 # Strategy 1: /url?q= redirect links (non-JS Google)
-                for a_tag in soup.find_all("a", href=True):
-                    href = a_tag["href"]
+                for a_tag in _XP_ANCHORS(root):
+                    href = a_tag.get("href")
                     if "/url?q=" not in href:
                         continue
                     actual = unquote(
@@ -354,17 +695,16 @@ class WebCrawlerScraper:
                     )
                     if not self._is_valid_result_url(actual):
                         continue
-                    if actual in seen:
+                    if not self._claim_url(actual):
                         continue
-                    seen.add(actual)
 
-                    title = a_tag.get_text(strip=True)[:150]
+                    title = _el_text(a_tag)[:150]
                     snippet = ""
-                    parent = a_tag.find_parent()
-                    if parent:
-                        nxt = parent.find_next_sibling()
-                        if nxt:
-                            snippet = nxt.get_text(strip=True)[:300]
+                    parent = a_tag.getparent()
+                    if parent is not None:
+                        nxt = _next_element(parent)
+                        if nxt is not None:
+                            snippet = _el_text(nxt)[:300]
 
                     results.append({
                         "url": actual, "title": title,
@@ -372,9 +712,9 @@ class WebCrawlerScraper:
                     })
 
                 # Strategy 2: div.g containers (JS-rendered, if any)
-                for div in soup.select("div.g"):
-                    a_tag = div.find("a", href=True)
-                    if not a_tag:
+                for div in _XP_GOOGLE_RESULTS(root):
+                    a_tag = div.find(".//a[@href]")
+                    if a_tag is None:
                         continue
                     href = a_tag.get("href", "")
                     if "/url?q=" in href:
@@ -383,24 +723,21 @@ class WebCrawlerScraper:
                         )
                     if not self._is_valid_result_url(href):
                         continue
-                    if href in seen:
+                    if not self._claim_url(href):
                         continue
-                    seen.add(href)
 
                     title = ""
-                    h3 = div.find("h3")
-                    if h3:
-                        title = h3.get_text(strip=True)[:150]
+                    h3 = div.find(".//h3")
+                    if h3 is not None:
+                        title = _el_text(h3)[:150]
                     snippet = ""
-                    for sel in (
-                        "div.VwiC3b", "div[data-sncf]", "span.st"
-                    ):
-                        s = div.select_one(sel)
-                        if s:
-                            snippet = s.get_text(strip=True)[:300]
+                    for xp in _XP_GOOGLE_SNIPPETS:
+                        found = xp(div)
+                        if found:
+                            snippet = _el_text(found[0])[:300]
                             break
                     if not snippet:
-                        snippet = div.get_text(strip=True)[:300]
+                        snippet = _el_text(div)[:300]
 
                     results.append({
                         "url": href, "title": title,
@@ -411,8 +748,6 @@ class WebCrawlerScraper:
                 logger.error("Google HTTP error: %s", e)
                 continue
 
-            time.sleep(2.0 + random.uniform(1.0, 3.0))
-
         return results
 
     # ---- Bing HTTP Search ----------------------------------------------
@@ -420,9 +755,9 @@ class WebCrawlerScraper:
     def _bing_search(self, query: str, num_pages: int = 3) -> list[dict]:
         """Search Bing via plain HTTP requests."""
         results: list[dict] = []
-        seen: set[str] = set()
 
         for page in range(num_pages):
+            self._throttle("www.bing.com")
             if self._should_stop:
                 break
 
@@ -438,50 +773,49 @@ class WebCrawlerScraper:
                     ),
                     timeout=12,
                 )
+                if resp.status_code == 429:
+                    self._back_off("www.bing.com", resp)
+                    continue
                 if resp.status_code != 200:
                     logger.warning("Bing HTTP %d", resp.status_code)
                     continue
 
-                soup = BeautifulSoup(resp.text, "lxml")
+                root = _parse_html(resp.text)
 
-                for item in soup.select("li.b_algo"):
-                    a_tag = item.select_one("h2 a")
-                    if not a_tag:
-                        a_tag = item.find("a", href=True)
-                    if not a_tag:
+                for item in _XP_BING_RESULTS(root):
+                    links = _XP_BING_TITLE_LINK(item)
+                    a_tag = links[0] if links else item.find(".//a[@href]")
+                    if a_tag is None:
                         continue
 
                     href = a_tag.get("href", "")
                     if not self._is_valid_result_url(href):
                         continue
-                    if href in seen:
+                    if not self._claim_url(href):
                         continue
-                    seen.add(href)
 
-                    title = a_tag.get_text(strip=True)[:150]
+                    title = _el_text(a_tag)[:150]
                     snippet = ""
-                    cap = item.select_one("div.b_caption p")
+                    cap = _XP_BING_CAPTION(item)
                     if cap:
-                        snippet = cap.get_text(strip=True)[:300]
+                        snippet = _el_text(cap[0])[:300]
                     else:
-                        p = item.find("p")
-                        if p:
-                            snippet = p.get_text(strip=True)[:300]
+                        p = item.find(".//p")
+                        if p is not None:
+                            snippet = _el_text(p)[:300]
 
                     results.append({
                         "url": href, "title": title,
                         "snippet": snippet,
                     })
 
-                if not soup.select_one("a.sb_pagN"):
+                if not _XP_BING_NEXT_PAGE(root):
                     break
 
             except Exception as e:
                 logger.error("Bing HTTP error: %s", e)
                 continue
 
-            time.sleep(1.5 + random.uniform(0.5, 2.0))
-
         return results
 
     # ---- DuckDuckGo Search (via ddgs library) ---------------------------
@@ -494,22 +828,24 @@ class WebCrawlerScraper:
         browser impersonation and anti-bot measures automatically.
         """
         results: list[dict] = []
-        seen: set[str] = set()
         max_results = num_pages * 10  # ~10 results per "page"
 
         try:
-            ddg_results = DDGS().text(
-                query, max_results=max_results,
-            )
+            self._throttle("duckduckgo.com")
+            with self._ddgs_lock:
+                if self._ddgs is None:
+                    self._ddgs = DDGS()
+                ddg_results = self._ddgs.text(
+                    query, max_results=max_results,
+                )
             for item in ddg_results:
                 if self._should_stop:
                     break
                 href = item.get("href", "")
                 if not self._is_valid_result_url(href):
                     continue
-                if href in seen:
+                if not self._claim_url(href):
                     continue
-                seen.add(href)
 
                 results.append({
                     "url": href,
@@ -530,7 +866,7 @@ class WebCrawlerScraper:
         """
         lead = WebLead()
         lead.website = url
-        lead.source = urlparse(url).netloc
+        lead.domain_key = lead.source = _url_host(url)
 
         if not url.startswith("http"):
             url = "https://" + url
@@ -543,211 +879,51 @@ class WebCrawlerScraper:
         all_phones: set[str] = set()
         found_socials: dict[str, str] = {k: "" for k in SOCIAL_PATTERNS}
 
-        for page_url in pages_to_check:
-            if self._should_stop:
-                break
-            try:
-                resp = self._http_session.get(
-                    page_url, timeout=8, allow_redirects=True,
-                )
-                if resp.status_code != 200:
-                    continue
-
-                text = resp.text
-                soup = BeautifulSoup(text, "lxml")
-
-                # Business name from <title> tag
-                if not lead.business_name:
-                    title_tag = soup.find("title")
-                    if title_tag and title_tag.string:
-                        name = title_tag.string.strip()
-                        for sep in [" | ", " - ", " \u2014 ", " \u2013 "]:
-                            if sep in name:
-                                name = name.split(sep)[0].strip()
-                        if name and len(name) < 100:
-                            lead.business_name = name
-
-                # Description from meta
-                if not lead.description:
-                    meta_desc = soup.find(
-                        "meta", attrs={"name": "description"}
+        # Pages are fetched concurrently, but parsed in their original
+        # order so the main page still wins for name / description.
+        deadline = time.monotonic() + _PAGE_BUDGET
+        futures = [
+            (page_url, _PAGE_FETCH_POOL.submit(
+                self._fetch_page, page_url, deadline,
+            ))
+            for page_url in pages_to_check
+        ]
+        budget_spent = False
+        try:
+            for page_url, future in futures:
+                if self._should_stop:
+                    break
+                try:
+                    # Small grace so a fetch that stops reading right at
+                    # the deadline still gets parsed; once the budget is
+                    # spent only pages that already finished are used
+                    timeout = 0 if budget_spent else (
+                        max(deadline - time.monotonic(), 0) + 0.5
+                    )
+                    text = future.result(timeout=timeout)
+                    if text is None:
+                        continue
+                    self._parse_page(
+                        text, lead, all_emails, all_phones, found_socials,
                     )
-                    if meta_desc and meta_desc.get("content"):
-                        lead.description = (
-                            meta_desc["content"].strip()[:200]
-                        )
-
-                # --- JSON-LD Structured Data Extraction ---
-                for script in soup.find_all(
-                    "script", type="application/ld+json",
-                ):
-                    try:
-                        ld_data = json.loads(script.string or "")
-                        # Handle @graph arrays
-                        items = [ld_data] if isinstance(ld_data, dict) else (
-                            ld_data if isinstance(ld_data, list) else []
-                        )
-                        if isinstance(ld_data, dict) and "@graph" in ld_data:
-                            items = ld_data["@graph"]
-
-                        for item in items:
-                            if not isinstance(item, dict):
-                                continue
-                            ld_type = str(item.get("@type", "")).lower()
-
-                            # Match LocalBusiness, Organization, etc.
-                            is_biz = any(t in ld_type for t in (
-                                "localbusiness", "organization", "store",
-                                "restaurant", "hotel", "medicalorganization",
-                                "dentist", "physician", "legalservice",
-                                "autodealer", "beautysalon", "barber",
-                            ))
-
-                            if is_biz:
-                                lead.has_structured_data = "Yes"
-
-                                # Business name from LD
-                                if not lead.business_name:
-                                    ld_name = item.get("name", "")
-                                    if ld_name and isinstance(ld_name, str):
-                                        lead.business_name = ld_name[:100]
-
-                                # Phone from LD
-                                ld_phone = item.get("telephone", "")
-                                if ld_phone and isinstance(ld_phone, str):
-                                    phone_clean = re.sub(r"[^\d+\-() ]", "", ld_phone).strip()
-                                    if len(phone_clean) >= 7:
-                                        all_phones.add(phone_clean)
-
-                                # Description from LD
-                                if not lead.description:
-                                    ld_desc = item.get("description", "")
-                                    if ld_desc and isinstance(ld_desc, str):
-                                        lead.description = ld_desc[:200]
-
-                                # Address from LD
-                                if not lead.address:
-                                    addr = item.get("address", {})
-                                    if isinstance(addr, dict):
-                                        parts = [
-                                            addr.get("streetAddress", ""),
-                                            addr.get("addressLocality", ""),
-                                            addr.get("addressRegion", ""),
-                                            addr.get("postalCode", ""),
-                                            addr.get("addressCountry", ""),
-                                        ]
-                                        full = ", ".join(
-                                            p for p in parts if p
-                                        )
-                                        if full:
-                                            lead.address = full[:200]
-
-                                # Operating hours from LD
-                                if not lead.operating_hours:
-                                    hours = item.get("openingHours")
-                                    if hours:
-                                        if isinstance(hours, list):
-                                            lead.operating_hours = "; ".join(
-                                                str(h) for h in hours
-                                            )[:200]
-                                        elif isinstance(hours, str):
-                                            lead.operating_hours = hours[:200]
-                                    # Also check openingHoursSpecification
-                                    hours_spec = item.get("openingHoursSpecification")
-                                    if not lead.operating_hours and hours_spec:
-                                        if isinstance(hours_spec, list):
-                                            parts = []
-                                            for spec in hours_spec[:7]:
-                                                if isinstance(spec, dict):
-                                                    days = spec.get("dayOfWeek", "")
-                                                    if isinstance(days, list):
-                                                        days = ", ".join(
-                                                            str(d).split("/")[-1] for d in days
-                                                        )
-                                                    opens = spec.get("opens", "")
-                                                    closes = spec.get("closes", "")
-                                                    if days and opens:
-                                                        parts.append(f"{days}: {opens}-{closes}")
-                                            if parts:
-                                                lead.operating_hours = "; ".join(parts)[:200]
-
-                                # Email from LD
-                                ld_email = item.get("email", "")
-                                if ld_email and isinstance(ld_email, str):
-                                    ld_email = ld_email.replace("mailto:", "").strip()
-                                    if self._is_valid_email(ld_email):
-                                        all_emails.add(ld_email.lower())
-
-                    except (json.JSONDecodeError, TypeError, ValueError):
-                        pass
-
-                # Emails from mailto: links
-                for a in soup.find_all("a", href=True):
-                    href_val = a["href"]
-                    if href_val.startswith("mailto:"):
-                        email = (
-                            href_val.replace("mailto:", "")
-                            .split("?")[0].strip()
-                        )
-                        if self._is_valid_email(email):
-                            all_emails.add(email.lower())
-
-                # Emails from page text
-                for match in EMAIL_RE.findall(text):
-                    if self._is_valid_email(match):
-                        all_emails.add(match.lower())
-
-                # Phones from tel: links
-                for a in soup.find_all("a", href=True):
-                    href_val = a["href"]
-                    if href_val.startswith("tel:"):
-                        phone = href_val.replace("tel:", "").strip()
-                        phone = re.sub(r"[^\d+\-() ]", "", phone)
-                        if len(phone) >= 7 and not PHONE_FALSE_POSITIVES.match(phone):
-                            all_phones.add(phone)
-
-                # Phones from page text (likely sections only)
-                for el in soup.find_all(
-                    ["p", "span", "div", "a", "li"],
-                    string=re.compile(
-                        r"(?:phone|tel|call|mobile|whatsapp|contact)",
-                        re.I,
-                    ),
-                ):
-                    parent_text = el.get_text()
-                    for m in PHONE_RE.findall(parent_text):
-                        cleaned = re.sub(
-                            r"[^\d+\-() ]", "", m,
-                        ).strip()
-                        if 7 <= len(cleaned) <= 20 and not PHONE_FALSE_POSITIVES.match(cleaned):
-                            all_phones.add(cleaned)
-
-                # Social links
-                for a in soup.find_all("a", href=True):
-                    href_val = a["href"]
-                    for platform, pattern in SOCIAL_PATTERNS.items():
-                        if not found_socials[platform]:
-                            mt = pattern.match(href_val)
-                            if mt:
-                                found_socials[platform] = mt.group(0)
-
-                # Social links from raw source (JS-embedded)
-                for platform, pattern in SOCIAL_PATTERNS.items():
-                    if not found_socials[platform]:
-                        mt = pattern.search(text)
-                        if mt:
-                            found_socials[platform] = mt.group(0)
 
-                # Early exit if we have everything
-                if (all_emails and all_phones
-                        and all(found_socials.values())):
-                    break
+                    # Early exit if we have everything
+                    if (all_emails and all_phones
+                            and all(found_socials.values())):
+                        break
 
-            except requests.RequestException:
-                continue
-            except Exception as e:
-                logger.debug("Error scraping %s: %s", page_url, e)
-                continue
+                except FutureTimeoutError:
+                    logger.debug("Page budget spent on %s", page_url)
+                    budget_spent = True
+                    continue
+                except requests.RequestException:
+                    continue
+                except Exception as e:
+                    logger.debug("Error scraping %s: %s", page_url, e)
+                    continue
+        finally:
+            for _, future in futures:
+                future.cancel()
 
         # Assign to lead
         if all_emails:
@@ -766,6 +942,217 @@ class WebCrawlerScraper:
             return lead
         return None
 
+    def _fetch_page(self, page_url: str, deadline: float) -> str | None:
+        """
+        Fetch one page of a website; ``None`` if it isn't a 200/206 HTML
+        response.  At most ``_MAX_PAGE_BYTES`` of the body are downloaded,
+        and nothing at all for errors, PDFs, images, etc.  Reading stops
+        at *deadline* (a ``time.monotonic()`` value); whatever arrived by
+        then is kept.
+        """
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return None
+        with self._page_session.get(
+            page_url, timeout=(min(3, remaining), min(5, remaining)),
+            allow_redirects=True,
+            stream=True,
+            headers={"Range": f"bytes=0-{_MAX_PAGE_BYTES - 1}"},
+        ) as resp:
+            if resp.status_code not in (200, 206):
+                return None
+            # A missing Content-Type is treated as HTML
+            ctype = resp.headers.get("Content-Type", "").lower()
+            if ctype and "html" not in ctype:
+                return None
+            # read1() returns after a single recv, and each recv may only
+            # wait for what is left of the budget
+            sock = getattr(resp.raw.connection, "sock", None)
+            chunks: list[bytes] = []
+            size = 0
+            while size < _MAX_PAGE_BYTES:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                if sock is not None:
+                    sock.settimeout(min(5, remaining))
+                try:
+                    chunk = resp.raw.read1(
+                        min(_READ_CHUNK, _MAX_PAGE_BYTES - size),
+                        decode_content=True,
+                    )
+                except ReadTimeoutError:
+                    break
+                if not chunk:
+                    break
+                chunks.append(chunk)
+                size += len(chunk)
+            body = b"".join(chunks)
+            return body.decode(resp.encoding or "utf-8", errors="replace")
+
+    def _parse_page(
+        self,
+        text: str,
+        lead: WebLead,
+        all_emails: set[str],
+        all_phones: set[str],
+        found_socials: dict[str, str],
+    ) -> None:
+        """Extract contact info from one page's HTML into the accumulators."""
+        root = _parse_html(text)
+
+        # Business name from <title> tag
+        if not lead.business_name:
+            titles = _XP_TITLE(root)
+            if titles:
+                name = titles[0].strip()
+                for sep in _TITLE_SEPS:
+                    if sep in name:
+                        name = name.split(sep)[0].strip()
+                if name and len(name) < 100:
+                    lead.business_name = name
+
+        # Description from meta
+        if not lead.description:
+            meta_desc = _XP_META_DESC(root)
+            if meta_desc and meta_desc[0]:
+                lead.description = meta_desc[0].strip()[:200]
+
+        # --- JSON-LD Structured Data Extraction ---
+        # Cheap substring check first: most pages carry no schema.org data.
+        ld_scripts = _XP_LD_JSON(root) if "ld+json" in text else ()
+        for ld_text in ld_scripts:
+            try:
+                for item in _ld_items(_json_loads(ld_text)):
+                    if not isinstance(item, dict):
+                        continue
+                    ld_type = str(item.get("@type", "")).lower()
+
+                    # Match LocalBusiness, Organization, etc.
+                    is_biz = any(t in ld_type for t in (
+                        "localbusiness", "organization", "store",
+                        "restaurant", "hotel", "medicalorganization",
+                        "dentist", "physician", "legalservice",
+                        "autodealer", "beautysalon", "barber",
+                    ))
+
+                    if is_biz:
+                        lead.has_structured_data = "Yes"
+
+                        # Business name from LD
+                        if not lead.business_name:
+                            ld_name = item.get("name", "")
+                            if ld_name and isinstance(ld_name, str):
+                                lead.business_name = ld_name[:100]
+
+                        # Phone from LD
+                        ld_phone = item.get("telephone", "")
+                        if ld_phone and isinstance(ld_phone, str):
+                            phone_clean = _PHONE_CLEAN_RE.sub("", ld_phone).strip()
+                            if len(phone_clean) >= 7:
+                                all_phones.add(phone_clean)
+
+                        # Description from LD
+                        if not lead.description:
+                            ld_desc = item.get("description", "")
+                            if ld_desc and isinstance(ld_desc, str):
+                                lead.description = ld_desc[:200]
+
+                        # Address from LD
+                        if not lead.address:
+                            addr = item.get("address", {})
+                            if isinstance(addr, dict):
+                                parts = [
+                                    addr.get("streetAddress", ""),
+                                    addr.get("addressLocality", ""),
+                                    addr.get("addressRegion", ""),
+                                    addr.get("postalCode", ""),
+                                    addr.get("addressCountry", ""),
+                                ]
+                                full = ", ".join(
+                                    p for p in parts if p
+                                )
+                                if full:
+                                    lead.address = full[:200]
+
+                        # Operating hours from LD
+                        if not lead.operating_hours:
+                            hours = item.get("openingHours")
+                            if hours:
+                                if isinstance(hours, list):
+                                    lead.operating_hours = "; ".join(
+                                        str(h) for h in hours
+                                    )[:200]
+                                elif isinstance(hours, str):
+                                    lead.operating_hours = hours[:200]
+                            # Also check openingHoursSpecification
+                            hours_spec = item.get("openingHoursSpecification")
+                            if not lead.operating_hours and hours_spec:
+                                if isinstance(hours_spec, list):
+                                    parts = []
+                                    for spec in hours_spec[:7]:
+                                        if isinstance(spec, dict):
+                                            days = spec.get("dayOfWeek", "")
+                                            if isinstance(days, list):
+                                                days = ", ".join(
+                                                    str(d).split("/")[-1] for d in days
+                                                )
+                                            opens = spec.get("opens", "")
+                                            closes = spec.get("closes", "")
+                                            if days and opens:
+                                                parts.append(f"{days}: {opens}-{closes}")
+                                    if parts:
+                                        lead.operating_hours = "; ".join(parts)[:200]
+
+                        # Email from LD
+                        ld_email = item.get("email", "")
+                        if ld_email and isinstance(ld_email, str):
+                            ld_email = ld_email.replace("mailto:", "").strip()
+                            if self._is_valid_email(ld_email):
+                                all_emails.add(ld_email.lower())
+
+            except (json.JSONDecodeError, TypeError, ValueError):
+                pass
+
+        # Emails (mailto:), phones (tel:) and social links, in a single
+        # pass over the anchors
+        for a in _XP_ANCHORS(root):
+            href_val = a.get("href")
+            low = href_val.lower()
+            if low.startswith("mailto:"):
+                email = href_val[7:].split("?")[0].strip()
+                if self._is_valid_email(email):
+                    all_emails.add(email.lower())
+            elif low.startswith("tel:"):
+                phone = _PHONE_CLEAN_RE.sub("", href_val[4:].strip())
+                if len(phone) >= 7 and not PHONE_FALSE_POSITIVES.match(phone):
+                    all_phones.add(phone)
+            elif any(hint in low for hint in _ANY_SOCIAL):
+                for platform, hint in _SOCIAL_HINTS:
+                    if hint in low and not found_socials[platform]:
+                        mt = SOCIAL_PATTERNS[platform].match(href_val)
+                        if mt:
+                            found_socials[platform] = mt.group(0)
+
+        # Phones from page text (likely sections only)
+        for el in _XP_CONTACT_CTX(root):
+            parent_text = el.text_content()
+            for m in PHONE_RE.findall(parent_text):
+                cleaned = _PHONE_CLEAN_RE.sub("", m).strip()
+                if 7 <= len(cleaned) <= 20 and not PHONE_FALSE_POSITIVES.match(cleaned):
+                    all_phones.add(cleaned)
+
+        # Emails + social links (incl. JS-embedded) from the raw source,
+        # in one pass.  Runs after the anchors so <a> links take priority.
+        for m in _CONTACTS_RE.finditer(text):
+            kind = m.lastgroup
+            if kind == "email":
+                email = m.group(0)
+                if self._is_valid_email(email):
+                    all_emails.add(email.lower())
+            elif not found_socials[kind]:
+                found_socials[kind] = m.group(0)
+
     @staticmethod
     def _is_valid_email(email: str) -> bool:
         if not email or "@" not in email:
@@ -800,7 +1187,7 @@ class WebCrawlerScraper:
 
         phones: set[str] = set()
         for m in PHONE_RE.findall(combined):
-            cleaned = re.sub(r"[^\d+\-() ]", "", m).strip()
+            cleaned = _PHONE_CLEAN_RE.sub("", m).strip()
             if 7 <= len(cleaned) <= 20:
                 phones.add(cleaned)
 
@@ -809,13 +1196,14 @@ class WebCrawlerScraper:
 
         lead = WebLead()
         lead.website = url
-        lead.source = urlparse(url).netloc if url else "search"
+        lead.domain_key = _url_host(url) if url else ""
+        lead.source = lead.domain_key or "search"
         lead.email = "; ".join(sorted(emails))
         lead.phone = "; ".join(sorted(phones)[:3])
 
         if title:
             name = title
-            for sep in [" | ", " - ", " \u2014 ", " \u2013 "]:
+            for sep in _TITLE_SEPS:
                 if sep in name:
                     name = name.split(sep)[0].strip()
             lead.business_name = name[:100]
@@ -825,6 +1213,36 @@ class WebCrawlerScraper:
 
         return lead
 
+    def _search_with_snippets(
+        self, search_fn, query: str, max_pages: int,
+        keyword: str, place: str,
+    ) -> list[tuple[dict, WebLead | None]]:
+        """
+        Run one search query and extract snippet leads from its results
+        in the same worker thread, pairing each result with its lead.
+        """
+        results = search_fn(query, max_pages)
+        return [
+            (r, self._extract_lead_from_snippet(r, keyword, place))
+            for r in results
+        ]
+
+    def _queue_site(
+        self, url: str, sites: set, pending: set,
+        pool: ThreadPoolExecutor,
+    ) -> None:
+        """
+        Start deep-scraping the site of *url* unless one of its URLs was
+        already queued.  Sites are told apart by host (minus ``www.``)
+        only: subdomains are often separate businesses, e.g. tenants of
+        hosted platforms such as ``joe.wordpress.com``.
+        """
+        host = _site_host(url)
+        if host in sites:
+            return
+        sites.add(host)
+        pending.add(pool.submit(self._scrape_website, url))
+
     # ---- Main scrape method -------------------------------------------
 
     def scrape(
@@ -836,8 +1254,9 @@ class WebCrawlerScraper:
         """
         Main scraping entry point.
 
-        Searches Google + Bing + DuckDuckGo via HTTP, then deep-scrapes
-        the found websites in parallel for emails, phones, and socials.
+        Searches Google + Bing + DuckDuckGo via HTTP and deep-scrapes the
+        found websites in parallel for emails, phones, and socials (each
+        site as soon as a search returns it).
 
         Args:
             keyword: Business type (e.g., "real estate", "plumber")
@@ -849,78 +1268,103 @@ class WebCrawlerScraper:
         """
         self._should_stop = False
         self._partial_leads = []
+        self._leads_found = 0
+        self._seen_urls = set()
+        # Site hosts already queued for deep-scraping; futures not yet
+        # collected stay in deep_pending.
+        sites: set[str] = set()
+        deep_pending: set[Future] = set()
+        # Per crawl, so that concurrent crawls don't queue behind each
+        # other and eat into one another's Phase 2 time budget
+        deep_pool = ThreadPoolExecutor(
+            max_workers=self.DEEP_SCRAPE_WORKERS,
+            thread_name_prefix="deep-scrape",
+        )
 
         try:
             self._report_progress("Building search queries...", 2)
 
             queries = self._build_queries(keyword, place)
             total_queries = len(queries)
-            all_search_results: list[dict] = []
             snippet_leads: list[WebLead] = []
             self._scrape_stats["total_queries"] = total_queries
             self._scrape_stats["phase"] = "searching"
 
-            # Phase 1: Search engines (HTTP - no browser needed)
-            for qi, (query, engine) in enumerate(queries):
-                if self._should_stop:
-                    break
-
-                pct = 3 + int((qi / total_queries) * 40)
-                self._report_progress(
-                    f"{engine.title()} search "
-                    f"({qi + 1}/{total_queries})...",
-                    pct,
-                )
-
-                if engine == "google":
-                    results = self._google_search(
-                        query, num_pages=max_pages,
-                    )
-                elif engine == "bing":
-                    results = self._bing_search(
-                        query, num_pages=max_pages,
-                    )
-                else:
-                    results = self._duckduckgo_search(
-                        query, num_pages=max_pages,
-                    )
-
-                all_search_results.extend(results)
-                self._scrape_stats["queries_completed"] = qi + 1
+            # Phase 1: Search engines (HTTP - no browser needed).
+            # Queries are IO-bound, so they run concurrently; politeness
+            # delays are applied per engine host by _throttle(). Snippet
+            # extraction runs in the same worker, so the loop below only
+            # merges -- and hands each new site straight to the
+            # deep-scrape pool, so Phase 2 overlaps the searches.
+            dispatch = {
+                "google": self._google_search,
+                "bing": self._bing_search,
+                "duckduckgo": self._duckduckgo_search,
+            }
+            with ExitStack() as stack:
+                # One executor per engine: workers sleeping in one engine's
+                # throttle (or CAPTCHA back-off) can't hold up the others
+                executors = {
+                    engine: stack.enter_context(ThreadPoolExecutor(
+                        max_workers=self.SEARCH_WORKERS_PER_ENGINE,
+                        thread_name_prefix=f"search-{engine}",
+                    ))
+                    for engine in dispatch
+                }
+                futures = {
+                    executors[engine].submit(
+                        self._search_with_snippets, dispatch[engine],
+                        query, max_pages, keyword, place,
+                    ): engine
+                    for query, engine in queries
+                }
+                # Registered after the executors, so it runs before their
+                # shutdown(wait=True): on stop or an exception, queued
+                # queries are dropped rather than run to completion.
+                def cancel_pending():
+                    for f in futures:
+                        f.cancel()
+
+                stack.callback(cancel_pending)
+                done_count = 0
+                for future in as_completed(futures):
+                    if self._should_stop:
+                        break
 
-                # Quick snippet extraction
-                for r in results:
-                    snippet_lead = self._extract_lead_from_snippet(
-                        r, keyword, place,
-                    )
-                    if snippet_lead:
-                        snippet_leads.append(snippet_lead)
-                        self._partial_leads.append(asdict(snippet_lead))
-                        self._scrape_stats["leads_found"] = len(
-                            self._partial_leads
+                    done_count += 1
+                    engine = futures[future]
+                    try:
+                        pairs = future.result()
+                    except Exception as e:
+                        logger.error("%s search error: %s", engine, e)
+                        pairs = []
+
+                    # Engines drop URLs an earlier query already returned
+                    # (see _claim_url), so every result here is new.
+                    for r, snippet_lead in pairs:
+                        self._queue_site(
+                            r["url"], sites, deep_pending, deep_pool,
                         )
+                        if snippet_lead:
+                            snippet_leads.append(snippet_lead)
+                            self._partial_leads.append(snippet_lead)
+                            self._leads_found += 1
+
+                    # Published after merging, so the stats include this
+                    # query's snippet leads and the last query's are not lost
+                    self._scrape_stats["queries_completed"] = done_count
+                    self._scrape_stats["leads_found"] = self._leads_found
+                    pct = 3 + int((done_count / total_queries) * 40)
+                    self._report_progress(
+                        f"{engine.title()} search "
+                        f"({done_count}/{total_queries})...",
+                        pct,
+                    )
 
-                # Delay between queries
-                if qi < total_queries - 1 and not self._should_stop:
-                    if engine == "google":
-                        time.sleep(random.uniform(2, 4))
-                    elif engine == "bing":
-                        time.sleep(random.uniform(1, 2))
-                    else:
-                        time.sleep(random.uniform(0.5, 1.5))
-
-            # Phase 2: Deduplicate and deep-scrape websites
-            seen_domains: set[str] = set()
-            unique_urls: list[str] = []
-            for r in all_search_results:
-                url = r["url"]
-                domain = urlparse(url).netloc.lower()
-                if domain not in seen_domains:
-                    seen_domains.add(domain)
-                    unique_urls.append(url)
-
-            total_urls = len(unique_urls)
+            # Phase 2: Collect the deep scrapes queued during Phase 1
+            total_urls = len(deep_pending)
             self._scrape_stats["total_websites"] = total_urls
+            self._scrape_stats["leads_found"] = self._leads_found
             self._scrape_stats["phase"] = "deep_scraping"
             self._report_progress(
                 f"Found {total_urls} unique websites + "
@@ -930,68 +1374,69 @@ class WebCrawlerScraper:
             )
 
             deep_leads: list[WebLead] = []
-            if unique_urls and not self._should_stop:
-                with ThreadPoolExecutor(max_workers=15) as executor:
-                    futures = {
-                        executor.submit(self._scrape_website, url): url
-                        for url in unique_urls
-                    }
-                    done_count = 0
-                    for future in as_completed(futures):
-                        done_count += 1
-                        self._scrape_stats["websites_scanned"] = (
-                            done_count
+            pending = deep_pending
+            if pending:
+                deadline = time.monotonic() + max(
+                    self.DEEP_SCRAPE_MIN_BUDGET,
+                    self.DEEP_SCRAPE_SECS_PER_SITE * total_urls,
+                )
+                done_count = 0
+                last_report = time.monotonic()
+                while pending and not self._should_stop:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        logger.info(
+                            "Deep-scrape time budget spent, skipping "
+                            "%d websites", len(pending),
                         )
-                        if self._should_stop:
-                            executor.shutdown(
-                                wait=False, cancel_futures=True,
-                            )
-                            break
+                        break
+                    # Short waits keep stop() responsive
+                    done, pending = wait(
+                        pending, timeout=min(remaining, 0.5),
+                        return_when=FIRST_COMPLETED,
+                    )
+                    for future in done:
+                        done_count += 1
                         try:
-                            lead = future.result(timeout=8)
-                            if lead:
-                                deep_leads.append(lead)
-                                self._partial_leads.append(
-                                    asdict(lead)
-                                )
-                                self._scrape_stats["leads_found"] = (
-                                    len(self._partial_leads)
-                                )
+                            lead = future.result()
                         except Exception as e:
-                            logger.debug(
-                                "Website scrape error: %s", e,
-                            )
-
-                        if (done_count % 5 == 0 or
-                                done_count == total_urls):
-                            pct = 45 + int(
-                                (done_count / total_urls) * 50
-                            )
-                            self._report_progress(
-                                f"Scraped {done_count}/{total_urls} "
-                                f"websites "
-                                f"({len(deep_leads)} leads found)...",
-                                min(pct, 95),
-                            )
-
-            # Phase 3: Merge snippet + deep leads, deduplicate
-            all_leads: list[WebLead] = []
-            seen_keys: set[str] = set()
-
-            for lead in deep_leads:
-                key = lead.website or lead.business_name
-                if key and key not in seen_keys:
-                    seen_keys.add(key)
-                    all_leads.append(lead)
-
-            for lead in snippet_leads:
-                key = lead.website or lead.business_name
-                if key and key not in seen_keys:
-                    seen_keys.add(key)
-                    all_leads.append(lead)
-
-            leads = [asdict(l) for l in all_leads]
-            self._partial_leads = list(leads)
+                            logger.debug("Website scrape error: %s", e)
+                            continue
+                        if lead:
+                            deep_leads.append(lead)
+                            self._partial_leads.append(lead)
+                            self._leads_found += 1
+                    if not done:
+                        continue
+
+                    now = time.monotonic()
+                    if (now - last_report >= self.PROGRESS_INTERVAL
+                            or done_count == total_urls):
+                        last_report = now
+                        self._scrape_stats["websites_scanned"] = done_count
+                        self._scrape_stats["leads_found"] = self._leads_found
+                        pct = 45 + int(
+                            (done_count / total_urls) * 50
+                        )
+                        self._report_progress(
+                            f"Scraped {done_count}/{total_urls} "
+                            f"websites "
+                            f"({len(deep_leads)} leads found)...",
+                            min(pct, 95),
+                        )
+                self._scrape_stats["websites_scanned"] = done_count
+
+            # Phase 3: Merge snippet + deep leads, one per domain (same
+            # key as clean_web_leads); deep leads win over snippet ones.
+            by_domain: dict[str, WebLead] = {}
+            for lead in chain(deep_leads, snippet_leads):
+                key = lead.domain_key or lead.business_name.lower()
+                if key:
+                    by_domain.setdefault(key, lead)
+            all_leads = list(by_domain.values())
+
+            leads = [l.to_dict() for l in all_leads]
+            self._partial_leads = all_leads
             self._scrape_stats["leads_found"] = len(leads)
             self._scrape_stats["phase"] = "done"
 
@@ -1010,50 +1455,72 @@ class WebCrawlerScraper:
                 -1,
             )
             raise
+        finally:
+            # Stop, time budget or error: drop scrapes that haven't run;
+            # running ones finish in the background
+            deep_pool.shutdown(wait=False, cancel_futures=True)
+            # Hosts rarely repeat across crawls; don't carry them over
+            _url_host.cache_clear()
 
         return leads
 
 
+# Shared by every WebCrawlerScraper, so keep-alive connections (and their
+# TLS sessions) are reused across crawls instead of per instance.
+_USER_AGENT = random.choice(WebCrawlerScraper.USER_AGENTS)
+_SESSION = _build_session(_USER_AGENT, _CappedRetry(
+    total=2, backoff_factor=0.05,
+    # No 429: a rate limit applies to every query queued for that engine,
+    # so the search code backs the whole host off via _throttle instead.
+    status_forcelist=(500, 502, 503, 504),
+    respect_retry_after_header=True,
+    raise_on_status=False,
+))
+# Deep-scrape page fetches: no retries (urllib3 would retry timeouts and
+# sleep on Retry-After inside get(), past the per-site budget) and only a
+# few redirects, so each fetch is bounded by its own timeouts.
+_PAGE_SESSION = _build_session(_USER_AGENT, 0)
+_PAGE_SESSION.max_redirects = 5
+
+
 # ---------------------------------------------------------------------------
 # Post-processing
 # ---------------------------------------------------------------------------
 
+# Output fields of a cleaned lead, in column order
+_LEAD_FIELDS = (
+    "business_name", "phone", "email", "website", "address",
+    "description", "operating_hours", "has_structured_data", "source",
+    "facebook", "instagram", "twitter", "linkedin", "youtube",
+)
+_NA = "N/A"
+
+
 def clean_web_leads(leads: list[dict]) -> list[dict]:
     """Clean and deduplicate web crawler leads."""
-    cleaned: list[dict] = []
-    seen: set[str] = set()
+    # First lead per key wins; the dict doubles as the "seen" set
+    cleaned: dict[str, dict] = {}
 
     for lead in leads:
         website = lead.get("website", "").strip()
         name = lead.get("business_name", "").strip()
-        domain = (
-            urlparse(website).netloc.lower() if website else ""
+        domain = lead.get("domain_key") or (
+            _url_host(website) if website else ""
         )
 
         key = domain or name.lower()
-        if not key or key in seen:
+        if not key or key in cleaned:
             continue
-        seen.add(key)
 
         phone = lead.get("phone", "")
         if phone:
-            phone = re.sub(r"[^\d+\-();, ]", "", phone).strip()
-
-        cleaned.append({
-            "business_name": name or "N/A",
-            "phone": phone or "N/A",
-            "email": lead.get("email", "N/A") or "N/A",
-            "website": website or "N/A",
-            "address": lead.get("address", "N/A") or "N/A",
-            "description": lead.get("description", "N/A") or "N/A",
-            "operating_hours": lead.get("operating_hours", "N/A") or "N/A",
-            "has_structured_data": lead.get("has_structured_data", "") or "",
-            "source": lead.get("source", "N/A") or "N/A",
-            "facebook": lead.get("facebook", "N/A") or "N/A",
-            "instagram": lead.get("instagram", "N/A") or "N/A",
-            "twitter": lead.get("twitter", "N/A") or "N/A",
-            "linkedin": lead.get("linkedin", "N/A") or "N/A",
-            "youtube": lead.get("youtube", "N/A") or "N/A",
-        })
-
-    return cleaned
+            phone = _PHONE_STRIP_RE.sub("", phone).strip()
+
+        out = {k: lead.get(k) or _NA for k in _LEAD_FIELDS}
+        out["business_name"] = name or _NA
+        out["phone"] = phone or _NA
+        out["website"] = website or _NA
+        out["has_structured_data"] = lead.get("has_structured_data") or ""
+        cleaned[key] = out
+
+    return list(cleaned.values())